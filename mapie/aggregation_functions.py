@@ -84,7 +84,8 @@ def phi2D(
 def aggregate_all(agg_function: Optional[str], X: NDArray) -> NDArray:
     """
     Applies np.nanmean(, axis=1) or np.nanmedian(, axis=1) according
-    to the string ``agg_function``.
+    to the string ``agg_function``. If ``X`` contains no nan,
+    np.mean(, axis=1) or np.median(, axis=1) are used instead.
 
     Parameters
     -----------
@@ -112,8 +113,14 @@ def aggregate_all(agg_function: Optional[str], X: NDArray) -> NDArray:
     array([14.5, 14.5])
 
     """
+    # The nan-aware reductions are much slower than the plain ones,
+    # so they are only used when X actually contains nans.
     if agg_function == "median":
-        return np.nanmedian(X, axis=1)
+        if np.isnan(X).any():
+            return np.nanmedian(X, axis=1)
+        return np.median(X, axis=1)
     elif agg_function == "mean":
-        return np.nanmean(X, axis=1)
+        if np.isnan(X).any():
+            return np.nanmean(X, axis=1)
+        return np.mean(X, axis=1)
     raise ValueError("Aggregation function called but not defined.")
@@ -633,8 +633,6 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):
         """
         X_train = _safe_indexing(X, train_index)
         y_train = _safe_indexing(y, train_index)
-        X_val = _safe_indexing(X, val_index)
-        y_val = _safe_indexing(y, val_index)
 
         if sample_weight is None:
             estimator = fit_estimator(
@@ -645,11 +643,13 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):
             estimator = fit_estimator(
                 estimator, X_train, y_train, sample_weight_train, **fit_params
             )
-        if _num_samples(X_val) > 0:
+        n_val = _num_samples(val_index)
+        if n_val > 0:
+            X_val = _safe_indexing(X, val_index)
             y_pred_proba = self._predict_oof_model(estimator, X_val)
         else:
             y_pred_proba = np.array([])
-        val_id = np.full_like(y_val, k, dtype=int)
+        val_id = np.full(n_val, k, dtype=int)
         return estimator, y_pred_proba, val_id, val_index
 
     def _get_true_label_cumsum_proba(
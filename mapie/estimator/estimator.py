@@ -253,11 +253,10 @@ class EnsembleRegressor(EnsembleEstimator):
         Tuple[NDArray, ArrayLike]
             Predictions of estimator from val_index of X.
         """
+        if _num_samples(val_index) == 0:
+            return np.array([]), val_index
         X_val = _safe_indexing(X, val_index)
-        if _num_samples(X_val) > 0:
-            y_pred = estimator.predict(X_val)
-        else:
-            y_pred = np.array([])
+        y_pred = estimator.predict(X_val)
         return y_pred, val_index
 
     def _aggregate_with_mask(
@@ -391,8 +390,6 @@ class EnsembleRegressor(EnsembleEstimator):
                     pred_matrix[ind, i] = np.array(
                         predictions[i], dtype=float
                     )
-                    self.k_[ind, i] = 1
-                check_nan_in_aposteriori_prediction(pred_matrix)
 
                 y_pred = aggregate_all(self.agg_function, pred_matrix)
 
@@ -473,6 +470,12 @@ class EnsembleRegressor(EnsembleEstimator):
             if self.method == "naive":
                 estimators_ = [single_estimator_]
             else:
+                cv_splits = list(cv.split(X, y, groups))
+                # Check that each sample has out-of-fold predictions
+                # before fitting the out-of-fold estimators.
+                for i, (_, val_index) in enumerate(cv_splits):
+                    self.k_[val_index, i] = 1
+                check_nan_in_aposteriori_prediction(self.k_)
                 estimators_ = Parallel(self.n_jobs, verbose=self.verbose)(
                     delayed(self._fit_oof_estimator)(
                         clone(estimator),
@@ -482,7 +485,7 @@ class EnsembleRegressor(EnsembleEstimator):
                         sample_weight,
                         **fit_params
                     )
-                    for train_index, _ in cv.split(X, y, groups)
+                    for train_index, _ in cv_splits
                 )
                 # In split-CP, we keep only the model fitted on train dataset
                 if self.use_split_method_:
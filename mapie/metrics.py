@@ -63,9 +63,9 @@ def regression_coverage_score(
     check_array_nan(y_pred_up)
     check_array_inf(y_pred_up)
 
-    coverage = np.mean(
-        ((y_pred_low <= y_true) & (y_pred_up >= y_true))
-    )
+    is_covered = np.less_equal(y_pred_low, y_true)
+    is_covered &= np.greater_equal(y_pred_up, y_true)
+    coverage = np.mean(is_covered)
     return float(coverage)
 
 
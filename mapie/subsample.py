@@ -135,7 +135,7 @@ class BlockBootstrap(BaseCrossValidator):  # type: ignore
     >>> X = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
     >>> for train_index, test_index in cv.split(X):
     ...    print(f"train index is {train_index}, test index is {test_index}")
-    train index is [1 2 3 4 5 6 1 2 3 4 5 6], test index is [8 9 7]
+    train index is [1 2 3 4 5 6 1 2 3 4 5 6], test index is [7 8 9]
     train index is [4 5 6 7 8 9 1 2 3 7 8 9], test index is []
     """
 
@@ -209,21 +209,19 @@ class BlockBootstrap(BaseCrossValidator):  # type: ignore
             )
 
         random_state = check_random_state(self.random_state)
+        # Draw the blocks of all resamplings at once and gather
+        # the training indices with a single fancy indexing.
+        block_indices = random_state.randint(
+            0, len(blocks), size=(self.n_resamplings, n_blocks)
+        )
+        train_indices = blocks[block_indices].reshape(
+            self.n_resamplings, n_blocks * length
+        )
+        is_train = np.zeros((self.n_resamplings, n), dtype=bool)
+        np.put_along_axis(is_train, train_indices, True, axis=1)
 
-        for k in range(self.n_resamplings):
-            block_indices = resample(
-                range(len(blocks)),
-                replace=True,
-                n_samples=n_blocks,
-                random_state=random_state,
-                stratify=None,
-            )
-            train_index = np.concatenate(
-                [blocks[k] for k in block_indices], axis=0
-            )
-            test_index = np.array(
-                list(set(indices) - set(train_index)), dtype=np.int64
-            )
+        for train_index, is_train_k in zip(train_indices, is_train):
+            test_index = indices[~is_train_k[indices]]
             yield train_index, test_index
 
     def get_n_splits(self, *args: Any, **kargs: Any) -> int:
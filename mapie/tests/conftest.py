@@ -0,0 +1,34 @@
+from typing import Any, List
+
+import pytest
+
+FITTED_FIXTURES = ["fitted_reg", "fitted_ts"]
+
+
+def pytest_configure(config: Any) -> None:
+    """
+    Register the ``xdist_group`` marker so runs without pytest-xdist
+    do not warn.
+    """
+    config.addinivalue_line(
+        "markers", "xdist_group(name): group tests on one xdist worker."
+    )
+
+
+def pytest_collection_modifyitems(items: List[Any]) -> None:
+    """
+    Group tests using a fitted estimator fixture by module and strategy,
+    so that with ``pytest -n auto --dist=loadgroup`` they run on the same
+    worker and reuse the estimator cached for their strategy.
+    """
+    for item in items:
+        params = getattr(item, "callspec", None)
+        if params is None:
+            continue
+        for name in FITTED_FIXTURES:
+            if name in params.params:
+                strategy = params.params[name]
+                item.add_marker(pytest.mark.xdist_group(
+                    name=f"{item.module.__name__}-{strategy}"
+                ))
+                break
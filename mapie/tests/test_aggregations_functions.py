@@ -1,6 +1,9 @@
+from typing import Any
+
 import numpy as np
+import pytest
 
-from mapie.aggregation_functions import phi1D, phi2D
+from mapie.aggregation_functions import aggregate_all, phi1D, phi2D
 
 
 def test_phi1D() -> None:
@@ -18,3 +21,19 @@ def test_phi2D() -> None:
     res = phi2D(A, B, fun=lambda x: np.nanmean(x, axis=1))
     assert res[0, 0] == 2.0
     assert res[1, 0] == 7.0
+
+
+@pytest.mark.parametrize(
+    "agg_function, nan_function",
+    [("mean", np.nanmean), ("median", np.nanmedian)]
+)
+def test_aggregate_all(agg_function: str, nan_function: Any) -> None:
+    """Test that aggregate_all ignores nans only when there are some."""
+    X = np.random.RandomState(1).normal(size=(50, 30))
+    np.testing.assert_allclose(
+        aggregate_all(agg_function, X), nan_function(X, axis=1)
+    )
+    X[::2, ::3] = np.nan
+    np.testing.assert_allclose(
+        aggregate_all(agg_function, X), nan_function(X, axis=1)
+    )
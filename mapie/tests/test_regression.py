@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from itertools import combinations
 from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
@@ -35,7 +34,7 @@ y_toy = np.array([5, 7, 9, 11, 13, 15])
 X, y = make_regression(
     n_samples=500, n_features=10, noise=1.0, random_state=1
 )
-k = np.ones(shape=(5, X.shape[1]))
+k = np.ones((5, X.shape[1]), dtype=np.float32)
 METHODS = ["naive", "base", "plus", "minmax"]
 
 random_state = 1
@@ -163,6 +162,22 @@ COVERAGES = {
 }
 
 
+@pytest.fixture(scope="session")
+def fitted_reg(request: Any) -> MapieRegressor:
+    """
+    Fit once per strategy on ``(X, y)`` and share the estimator
+    across tests. Tests using it must only call ``predict``.
+    """
+    mapie_reg = MapieRegressor(**STRATEGIES[request.param])
+    return mapie_reg.fit(X, y)
+
+
+@pytest.fixture(scope="session")
+def prefit_estimator() -> LinearRegression:
+    """Fit once a ``LinearRegression`` on ``(X, y)`` for prefit tests."""
+    return LinearRegression().fit(X, y)
+
+
 def test_default_parameters() -> None:
     """Test default values of input parameters."""
     mapie_reg = MapieRegressor()
@@ -197,9 +212,12 @@ def test_invalid_agg_function(agg_function: Any) -> None:
     with pytest.raises(ValueError, match=r".*Invalid aggregation function.*"):
         mapie_reg.fit(X_toy, y_toy)
 
+
+def test_none_agg_function_with_ensemble() -> None:
+    """Test that ensemble predictions without agg_function raise errors."""
     mapie_reg = MapieRegressor(agg_function=None)
+    mapie_reg.fit(X_toy, y_toy)
     with pytest.raises(ValueError, match=r".*If ensemble is True*"):
-        mapie_reg.fit(X_toy, y_toy)
         mapie_reg.predict(X_toy, ensemble=True)
 
 
@@ -279,15 +297,13 @@ def test_same_results_prefit_split() -> None:
     np.testing.assert_allclose(y_pis_1[:, 1, 0], y_pis_2[:, 1, 0])
 
 
-@pytest.mark.parametrize("strategy", [*STRATEGIES])
-def test_results_for_same_alpha(strategy: str) -> None:
+@pytest.mark.parametrize("fitted_reg", [*STRATEGIES], indirect=True)
+def test_results_for_same_alpha(fitted_reg: MapieRegressor) -> None:
     """
     Test that predictions and intervals
     are similar with two equal values of alpha.
     """
-    mapie_reg = MapieRegressor(**STRATEGIES[strategy])
-    mapie_reg.fit(X, y)
-    _, y_pis = mapie_reg.predict(X, alpha=[0.1, 0.1])
+    _, y_pis = fitted_reg.predict(X, alpha=[0.1, 0.1])
     np.testing.assert_allclose(y_pis[:, 0, 0], y_pis[:, 0, 1])
     np.testing.assert_allclose(y_pis[:, 1, 0], y_pis[:, 1, 1])
 
@@ -311,15 +327,13 @@ def test_results_for_alpha_as_float_and_arraylike(
     np.testing.assert_allclose(y_pis_float2[:, :, 0], y_pis_array[:, :, 1])
 
 
-@pytest.mark.parametrize("strategy", [*STRATEGIES])
-def test_results_for_ordered_alpha(strategy: str) -> None:
+@pytest.mark.parametrize("fitted_reg", [*STRATEGIES], indirect=True)
+def test_results_for_ordered_alpha(fitted_reg: MapieRegressor) -> None:
     """
     Test that prediction intervals lower (upper) bounds give
     consistent results for ordered alphas.
     """
-    mapie = MapieRegressor(**STRATEGIES[strategy])
-    mapie.fit(X, y)
-    y_pred, y_pis = mapie.predict(X, alpha=[0.05, 0.1])
+    y_pred, y_pis = fitted_reg.predict(X, alpha=[0.05, 0.1])
     assert (y_pis[:, 0, 0] <= y_pis[:, 0, 1]).all()
     assert (y_pis[:, 1, 0] >= y_pis[:, 1, 1]).all()
 
@@ -485,28 +499,36 @@ def test_linear_regression_results(strategy: str) -> None:
     np.testing.assert_allclose(coverage, COVERAGES[strategy], rtol=1e-2)
 
 
-def test_results_prefit_ignore_method() -> None:
-    """Test that method is ignored when ``cv="prefit"``."""
-    estimator = LinearRegression().fit(X, y)
+def test_results_prefit_ignore_method(
+    prefit_estimator: LinearRegression
+) -> None:
+    """
+    Test that method is ignored when ``cv="prefit"``. As it is bypassed
+    during ``fit``, calibrating on a few samples is enough.
+    """
     all_y_pis: List[NDArray] = []
     for method in METHODS:
         mapie_reg = MapieRegressor(
-            estimator=estimator, cv="prefit", method=method
+            estimator=prefit_estimator, cv="prefit", method=method
         )
-        mapie_reg.fit(X, y)
+        mapie_reg.fit(X[:10], y[:10])
+        assert mapie_reg.method == "base"
         _, y_pis = mapie_reg.predict(X, alpha=0.1)
         all_y_pis.append(y_pis)
-    for y_pis1, y_pis2 in combinations(all_y_pis, 2):
-        np.testing.assert_allclose(y_pis1, y_pis2)
+    stacked_y_pis = np.stack(all_y_pis, axis=0)
+    np.testing.assert_allclose(
+        stacked_y_pis,
+        np.broadcast_to(stacked_y_pis[0], stacked_y_pis.shape),
+        rtol=1e-12
+    )
 
 
-def test_results_prefit_naive() -> None:
+def test_results_prefit_naive(prefit_estimator: LinearRegression) -> None:
     """
     Test that prefit, fit and predict on the same dataset
     is equivalent to the "naive" method.
     """
-    estimator = LinearRegression().fit(X, y)
-    mapie_reg = MapieRegressor(estimator=estimator, cv="prefit")
+    mapie_reg = MapieRegressor(estimator=prefit_estimator, cv="prefit")
     mapie_reg.fit(X, y)
     _, y_pis = mapie_reg.predict(X, alpha=0.05)
     width_mean = (y_pis[:, 1, 0] - y_pis[:, 0, 0]).mean()
@@ -570,11 +592,13 @@ def test_invalid_aggregate_all() -> None:
         aggregate_all(None, X)
 
 
-def test_aggregate_with_mask_with_prefit() -> None:
+def test_aggregate_with_mask_with_prefit(
+    prefit_estimator: LinearRegression
+) -> None:
     """
     Test ``_aggregate_with_mask`` in case ``cv`` is ``"prefit"``.
     """
-    mapie_reg = MapieRegressor(LinearRegression().fit(X, y), cv="prefit")
+    mapie_reg = MapieRegressor(prefit_estimator, cv="prefit")
     mapie_reg = mapie_reg.fit(X, y)
     with pytest.raises(
         ValueError,
@@ -73,6 +73,16 @@ def test_split_BlockBootstrap() -> None:
     np.testing.assert_equal(tests, tests_expected)
 
 
+@pytest.mark.parametrize("overlapping", [False, True])
+def test_split_BlockBootstrap_no_resampling(overlapping: bool) -> None:
+    """Test that no split is generated if ``n_resamplings`` is 0."""
+    X = np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+    cv = BlockBootstrap(
+        n_resamplings=0, length=2, overlapping=overlapping, random_state=1
+    )
+    assert list(cv.split(X)) == []
+
+
 def test_split_BlockBootstrap_error_below_zero() -> None:
     """Test outputs of subsamplings for length block below 0."""
     X = np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
@@ -1,16 +1,16 @@
 from __future__ import annotations
 
-from typing import Any, Optional, Tuple, Union
+from typing import Any, Optional, Union
 
 import numpy as np
 import pytest
+from sklearn.base import clone
 from sklearn.datasets import make_regression
 from sklearn.linear_model import LinearRegression
 from sklearn.model_selection import KFold, LeaveOneOut, train_test_split
 from sklearn.utils.estimator_checks import check_estimator
 from typing_extensions import TypedDict
 
-from mapie._typing import NDArray
 from mapie.aggregation_functions import aggregate_all
 from mapie.conformity_scores import AbsoluteConformityScore
 from mapie.metrics import regression_coverage_score
@@ -23,7 +23,9 @@ y_toy = (5.0 + 2.0 * X_toy ** 1.1).flatten()
 X, y = make_regression(
     n_samples=500, n_features=10, noise=1.0, random_state=random_state
 )
-k = np.ones(shape=(5, X.shape[1]))
+X_small, y_small = make_regression(
+    n_samples=80, n_features=10, noise=1.0, random_state=random_state
+)
 METHODS = ["enbpi", "aci"]
 UPDATE_DATA = ([6], 17.5)
 CONFORMITY_SCORES = [14.189 - 14.038, 17.5 - 18.665]
@@ -36,60 +38,39 @@ Params = TypedDict(
         "cv": Optional[Union[int, KFold, BlockBootstrap]],
     },
 )
+BLOCK_BOOTSTRAP = BlockBootstrap(
+    n_resamplings=30, n_blocks=5, random_state=random_state
+)
 STRATEGIES = {
     "blockbootstrap_enbpi_mean_wopt": Params(
         method="enbpi",
         agg_function="mean",
-        cv=BlockBootstrap(
-            n_resamplings=30,
-            n_blocks=5,
-            random_state=random_state
-        ),
+        cv=BLOCK_BOOTSTRAP,
     ),
     "blockbootstrap_enbpi_median_wopt": Params(
         method="enbpi",
         agg_function="median",
-        cv=BlockBootstrap(
-            n_resamplings=30,
-            n_blocks=5,
-            random_state=random_state
-        ),
+        cv=BLOCK_BOOTSTRAP,
     ),
     "blockbootstrap_enbpi_mean": Params(
         method="enbpi",
         agg_function="mean",
-        cv=BlockBootstrap(
-            n_resamplings=30,
-            n_blocks=5,
-            random_state=random_state
-        ),
+        cv=BLOCK_BOOTSTRAP,
     ),
     "blockbootstrap_enbpi_median": Params(
         method="enbpi",
         agg_function="median",
-        cv=BlockBootstrap(
-            n_resamplings=30,
-            n_blocks=5,
-            random_state=random_state
-        ),
+        cv=BLOCK_BOOTSTRAP,
     ),
     "blockbootstrap_aci_mean": Params(
         method="aci",
         agg_function="mean",
-        cv=BlockBootstrap(
-            n_resamplings=30,
-            n_blocks=5,
-            random_state=random_state
-        ),
+        cv=BLOCK_BOOTSTRAP,
     ),
     "blockbootstrap_aci_median": Params(
         method="aci",
         agg_function="median",
-        cv=BlockBootstrap(
-            n_resamplings=30,
-            n_blocks=5,
-            random_state=random_state
-        ),
+        cv=BLOCK_BOOTSTRAP,
     ),
 }
 
@@ -114,6 +95,16 @@ COVERAGES = {
 }
 
 
+@pytest.fixture(scope="session")
+def fitted_ts(request: Any) -> MapieTimeSeriesRegressor:
+    """
+    Fit once per strategy on ``(X_small, y_small)`` and share the estimator
+    across tests. Tests using it must only call ``predict``.
+    """
+    mapie_ts_reg = MapieTimeSeriesRegressor(**STRATEGIES[request.param])
+    return mapie_ts_reg.fit(X_small, y_small)
+
+
 def test_sklearn_checks() -> None:
     """
     Test that all sklearn estimator checks pass as intended.
@@ -132,69 +123,72 @@ def test_invalid_agg_function(agg_function: Any) -> None:
     with pytest.raises(ValueError, match=r".*Invalid aggregation function.*"):
         mapie_reg.fit(X_toy, y_toy)
 
+
+def test_none_agg_function_with_ensemble() -> None:
+    """Test that ensemble predictions without agg_function raise errors."""
     mapie_reg = MapieTimeSeriesRegressor(agg_function=None)
+    mapie_reg.fit(X_toy, y_toy)
     with pytest.raises(ValueError, match=r".*If ensemble is True*"):
-        mapie_reg.fit(X_toy, y_toy)
         mapie_reg.predict(X_toy, ensemble=True)
 
 
-@pytest.mark.parametrize("strategy", [*STRATEGIES])
-@pytest.mark.parametrize("dataset", [(X, y), (X_toy, y_toy)])
+@pytest.mark.parametrize("fitted_ts", [*STRATEGIES], indirect=True)
 @pytest.mark.parametrize("alpha", [0.2, [0.2, 0.4], (0.2, 0.4)])
 def test_predict_output_shape(
-    strategy: str, alpha: Any, dataset: Tuple[NDArray, NDArray]
+    fitted_ts: MapieTimeSeriesRegressor, alpha: Any
 ) -> None:
     """Test predict output shape."""
-    mapie_ts_reg = MapieTimeSeriesRegressor(**STRATEGIES[strategy])
-    (X, y) = dataset
-    mapie_ts_reg.fit(X, y)
-    y_pred, y_pis = mapie_ts_reg.predict(X, alpha=alpha)
+    y_pred, y_pis = fitted_ts.predict(X_small, alpha=alpha)
     n_alpha = len(alpha) if hasattr(alpha, "__len__") else 1
-    assert y_pred.shape == (X.shape[0],)
-    assert y_pis.shape == (X.shape[0], 2, n_alpha)
+    assert y_pred.shape == (X_small.shape[0],)
+    assert y_pis.shape == (X_small.shape[0], 2, n_alpha)
 
 
-@pytest.mark.parametrize("strategy", [*STRATEGIES])
-def test_results_for_same_alpha(strategy: str) -> None:
+def test_predict_output_shape_toy() -> None:
+    """Test predict output shape on the toy dataset."""
+    mapie_ts_reg = MapieTimeSeriesRegressor(
+        **STRATEGIES["blockbootstrap_enbpi_mean"]
+    )
+    y_pred, y_pis = mapie_ts_reg.fit(X_toy, y_toy).predict(X_toy, alpha=0.2)
+    assert y_pred.shape == (X_toy.shape[0],)
+    assert y_pis.shape == (X_toy.shape[0], 2, 1)
+
+
+@pytest.mark.parametrize("fitted_ts", [*STRATEGIES], indirect=True)
+def test_results_for_same_alpha(fitted_ts: MapieTimeSeriesRegressor) -> None:
     """
     Test that predictions and intervals
     are similar with two equal values of alpha.
     """
-    mapie_ts_reg = MapieTimeSeriesRegressor(**STRATEGIES[strategy])
-    mapie_ts_reg.fit(X, y)
-    _, y_pis = mapie_ts_reg.predict(X, alpha=[0.1, 0.1])
-    np.testing.assert_allclose(y_pis[:, 0, 0], y_pis[:, 0, 1])
-    np.testing.assert_allclose(y_pis[:, 1, 0], y_pis[:, 1, 1])
+    _, y_pis = fitted_ts.predict(X_small, alpha=[0.1, 0.1])
+    np.testing.assert_array_equal(y_pis[:, 0, 0], y_pis[:, 0, 1])
+    np.testing.assert_array_equal(y_pis[:, 1, 0], y_pis[:, 1, 1])
 
 
-@pytest.mark.parametrize("strategy", [*STRATEGIES])
-@pytest.mark.parametrize(
-    "alpha", [np.array([0.05, 0.1]), [0.05, 0.1], (0.05, 0.1)]
-)
-def test_results_for_alpha_as_float_and_arraylike(
-    strategy: str, alpha: Any
-) -> None:
+@pytest.mark.parametrize("fitted_ts", [*STRATEGIES], indirect=True)
+def test_alpha_accepts_list_tuple(fitted_ts: MapieTimeSeriesRegressor) -> None:
     """Test that output values do not depend on type of alpha."""
-    mapie_ts_reg = MapieTimeSeriesRegressor(**STRATEGIES[strategy])
-    mapie_ts_reg.fit(X, y)
-    y_pred_float1, y_pis_float1 = mapie_ts_reg.predict(X, alpha=alpha[0])
-    y_pred_float2, y_pis_float2 = mapie_ts_reg.predict(X, alpha=alpha[1])
-    y_pred_array, y_pis_array = mapie_ts_reg.predict(X, alpha=alpha)
-    np.testing.assert_allclose(y_pred_float1, y_pred_array)
-    np.testing.assert_allclose(y_pred_float2, y_pred_array)
-    np.testing.assert_allclose(y_pis_float1[:, :, 0], y_pis_array[:, :, 0])
-    np.testing.assert_allclose(y_pis_float2[:, :, 0], y_pis_array[:, :, 1])
-
-
-@pytest.mark.parametrize("strategy", [*STRATEGIES])
-def test_results_for_ordered_alpha(strategy: str) -> None:
+    alpha = np.array([0.05, 0.1])
+    y_pred_array, y_pis_array = fitted_ts.predict(X_small, alpha=alpha)
+    for alpha_container in [list(alpha), tuple(alpha)]:
+        y_pred, y_pis = fitted_ts.predict(X_small, alpha=alpha_container)
+        np.testing.assert_array_equal(y_pred, y_pred_array)
+        np.testing.assert_array_equal(y_pis, y_pis_array)
+    y_pred_float, y_pis_float = fitted_ts.predict(X_small, alpha=alpha[0])
+    np.testing.assert_array_equal(y_pred_float, y_pred_array)
+    np.testing.assert_array_equal(y_pis_float[:, :, 0], y_pis_array[:, :, 0])
+
+
+@pytest.mark.parametrize("fitted_ts", [*STRATEGIES], indirect=True)
+def test_results_for_ordered_alpha(
+    fitted_ts: MapieTimeSeriesRegressor
+) -> None:
     """
-    Test that prediction intervals lower (upper) bounds give
-    consistent results for ordered alphas.
+    Test that prediction intervals lower (upper) bounds are finite
+    and give consistent results for ordered alphas.
     """
-    mapie = MapieTimeSeriesRegressor(**STRATEGIES[strategy])
-    mapie.fit(X, y)
-    y_pred, y_pis = mapie.predict(X, alpha=[0.05, 0.1])
+    y_pred, y_pis = fitted_ts.predict(X_small, alpha=[0.05, 0.1])
+    assert np.isfinite(y_pis).all()
     assert np.all(
         np.abs(y_pis[:, 1, 0] - y_pis[:, 0, 0])
         >= np.abs(y_pis[:, 1, 1] - y_pis[:, 0, 1])
@@ -213,51 +207,49 @@ def test_results_single_and_multi_jobs(strategy: str) -> None:
     mapie_multi.fit(X_toy, y_toy)
     y_pred_single, y_pis_single = mapie_single.predict(X_toy, alpha=0.2)
     y_pred_multi, y_pis_multi = mapie_multi.predict(X_toy, alpha=0.2)
-    np.testing.assert_allclose(y_pred_single, y_pred_multi)
-    np.testing.assert_allclose(y_pis_single, y_pis_multi)
+    np.testing.assert_array_equal(y_pred_single, y_pred_multi)
+    np.testing.assert_array_equal(y_pis_single, y_pis_multi)
 
 
-@pytest.mark.parametrize("strategy", [*STRATEGIES])
-def test_results_with_constant_sample_weights(strategy: str) -> None:
+@pytest.mark.parametrize("fitted_ts", [*STRATEGIES], indirect=True)
+def test_results_with_constant_sample_weights(
+    fitted_ts: MapieTimeSeriesRegressor
+) -> None:
     """
-    Test predictions when sample weights are None
-    or constant with different values.
+    Test predictions when sample weights are None or constant.
+    The invariance to the value of constant weights is tested
+    at the estimator level in ``test_utils``.
     """
-    n_samples = len(X)
-    mapie0 = MapieTimeSeriesRegressor(**STRATEGIES[strategy])
-    mapie1 = MapieTimeSeriesRegressor(**STRATEGIES[strategy])
-    mapie2 = MapieTimeSeriesRegressor(**STRATEGIES[strategy])
-    mapie0.fit(X, y, sample_weight=None)
-    mapie1.fit(X, y, sample_weight=np.ones(shape=n_samples))
-    mapie2.fit(X, y, sample_weight=np.ones(shape=n_samples) * 5)
-    y_pred0, y_pis0 = mapie0.predict(X, alpha=0.05)
-    y_pred1, y_pis1 = mapie1.predict(X, alpha=0.05)
-    y_pred2, y_pis2 = mapie2.predict(X, alpha=0.05)
+    n_samples = len(X_small)
+    mapie0 = fitted_ts
+    mapie1 = clone(fitted_ts)
+    mapie1.fit(X_small, y_small, sample_weight=np.ones(shape=n_samples))
+    y_pred0, y_pis0 = mapie0.predict(X_small, alpha=0.05)
+    y_pred1, y_pis1 = mapie1.predict(X_small, alpha=0.05)
     np.testing.assert_allclose(y_pred0, y_pred1)
-    np.testing.assert_allclose(y_pred1, y_pred2)
     np.testing.assert_allclose(y_pis0, y_pis1)
-    np.testing.assert_allclose(y_pis1, y_pis2)
 
 
 @pytest.mark.parametrize("method", ["enbpi", "aci"])
 @pytest.mark.parametrize("cv", [-1, 2, 3, 5])
 @pytest.mark.parametrize("agg_function", ["mean", "median"])
-@pytest.mark.parametrize("alpha", [0.05, 0.1, 0.2])
 def test_prediction_agg_function(
-    method: str, cv: Union[LeaveOneOut, KFold], agg_function: str, alpha: int
+    method: str, cv: Union[LeaveOneOut, KFold], agg_function: str
 ) -> None:
     """
     Test that PIs are the same but predictions differ when ensemble is
     True or False.
     """
+    alpha = [0.05, 0.1, 0.2]
     mapie = MapieTimeSeriesRegressor(
         method=method, cv=cv, agg_function=agg_function
     )
     mapie.fit(X, y)
     y_pred_1, y_pis_1 = mapie.predict(X, ensemble=True, alpha=alpha)
     y_pred_2, y_pis_2 = mapie.predict(X, ensemble=False, alpha=alpha)
-    np.testing.assert_allclose(y_pis_1[:, 0, 0], y_pis_2[:, 0, 0])
-    np.testing.assert_allclose(y_pis_1[:, 1, 0], y_pis_2[:, 1, 0])
+    for i in range(len(alpha)):
+        np.testing.assert_allclose(y_pis_1[:, 0, i], y_pis_2[:, 0, i])
+        np.testing.assert_allclose(y_pis_1[:, 1, i], y_pis_2[:, 1, i])
     with pytest.raises(AssertionError):
         np.testing.assert_allclose(y_pred_1, y_pred_2)
 
@@ -412,9 +404,7 @@ def test_interval_prediction_with_beta_optimize() -> None:
     estimator = LinearRegression().fit(X_train, y_train)
     mapie_ts_reg = MapieTimeSeriesRegressor(
         estimator=estimator,
-        cv=BlockBootstrap(
-            n_resamplings=30, n_blocks=5, random_state=random_state
-        )
+        cv=BLOCK_BOOTSTRAP
     )
     mapie_ts_reg.fit(X_val, y_val)
     mapie_ts_reg.update(X_val, y_val)
@@ -126,6 +126,16 @@ def test_fit_estimator_sample_weight() -> None:
         np.testing.assert_almost_equal(y_pred_1, y_pred_2)
 
 
+def test_fit_estimator_constant_sample_weight() -> None:
+    """Test that constant sample weights give the same fit whatever value."""
+    sample_weight = np.ones(shape=len(y))
+    sw_1, X_1, y_1 = check_null_weight(sample_weight, X, y)
+    sw_5, X_5, y_5 = check_null_weight(sample_weight * 5, X, y)
+    estimator_1 = fit_estimator(LinearRegression(), X_1, y_1, sw_1)
+    estimator_5 = fit_estimator(LinearRegression(), X_5, y_5, sw_5)
+    np.testing.assert_allclose(estimator_1.predict(X), estimator_5.predict(X))
+
+
 @pytest.mark.parametrize("alpha", [-1, 0, 1, 2, 2.5, "a", ["a", "b"]])
 def test_invalid_alpha(alpha: Any) -> None:
     """Test that invalid alphas raise errors."""
@@ -516,8 +516,10 @@ def check_nan_in_aposteriori_prediction(X: ArrayLike) -> None:
 
     Parameters
     ----------
-    X: Array of shape (size of training set, number of estimators) whose rows
-    are the predictions by each estimator of each training sample.
+    X: Array of shape (size of training set, number of estimators)
+        Any array whose nans mark the missing out-of-fold predictions
+        of each estimator for each training sample, e.g. the predictions
+        themselves or the 1-or-nan out-of-fold mask.
 
     Raises
     ------